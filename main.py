@@ -20,11 +20,13 @@ Assets expected:
 """
 
 import asyncio
+import functools
 import json
 import math
 import os
 import random
 import sys
+from dataclasses import dataclass, fields
 
 import pygame
 
@@ -37,6 +39,10 @@ try:
 except Exception:
     # Browser context may not support specific mixer args before user interaction
     pygame.mixer.init()
+# Channels 0 & 1 are kept for the frequent flap & coin effects so their
+# play() never has to search for (or steal) a free channel
+pygame.mixer.set_num_channels(16)
+pygame.mixer.set_reserved(2)
 
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -54,6 +60,9 @@ STONE_DARK = (85, 60, 38)
 STONE_LIGHT = (170, 130, 85)
 STONE_EDGE = (65, 45, 28)
 MOSS_GREEN = (70, 95, 40)
+# Moss at alpha 120 pre-blended over stone, so it can be drawn opaque
+MOSS_ON_STONE = tuple(b + (m - b) * 120 // 255
+                      for m, b in zip(MOSS_GREEN, STONE_BASE))
 TEXT_GOLD = (255, 220, 110)
 TEXT_SHADOW = (50, 35, 18)
 BTN_NORMAL = (165, 105, 55)
@@ -77,6 +86,24 @@ ENEMY_W, ENEMY_H = 70, 70
 COIN_W, COIN_H = 32, 32
 WALL_WIDTH = 72
 WALL_TIP = 22  # length of the jagged rocky tip (pixels)
+WALL_MARGIN = 70  # shortest pillar body allowed by gap placement
+ROCK_HEIGHT_STEP = 40  # pillar heights are rounded up to this bucket size
+PILLAR_VARIANTS = 8  # pre-rendered looks per (height bucket, direction)
+
+# ── Sine lookup table (bob/wave paths are cosmetic, so 1024 steps) ────
+SIN_LUT_SIZE = 1024  # must stay a power of two for the & mask
+SIN_LUT_MASK = SIN_LUT_SIZE - 1
+_SIN_LUT = [math.sin(2 * math.pi * i / SIN_LUT_SIZE)
+            for i in range(SIN_LUT_SIZE)]
+
+
+def lut_step(radians):
+    """Convert a per-frame phase advance in radians to _SIN_LUT steps."""
+    return round(radians * SIN_LUT_SIZE / (2 * math.pi))
+
+
+PLAYER_BOB_STEP = lut_step(0.04)
+COIN_BOB_STEP = lut_step(0.08)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -90,10 +117,46 @@ def load_scaled_image(filename, size):
     return pygame.transform.smoothscale(img, size)
 
 
+@functools.lru_cache(maxsize=256)
+def render_text(font, text, colour):
+    """Render anti-aliased *text*, memoised since most strings repeat
+    frame after frame."""
+    return font.render(text, True, colour)
+
+
+@dataclass(slots=True)
+class Level:
+    """One difficulty tier from levels.json; missing keys use these
+    defaults."""
+    name: str = ""
+    score_threshold: int = 999999
+    gravity: float = 0.3
+    wall_speed: float = 2.0
+    gap_size: int = 200
+    wall_spacing: int = 350
+    enemy_speed: float = 1.5
+    enemy_spawn_frames: int = 500
+    coin_spawn_chance: float = 0.5
+    max_coins_on_screen: int = 3
+    coin_speed_multiplier: float = 1.0
+    coin_min_gap_from_walls_px: int = 100
+    coin_y_padding_px: int = 50
+    coin_value: int = 1
+
+    @classmethod
+    def from_dict(cls, data, index=0):
+        """Build a Level from a JSON entry, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        kwargs = {k: v for k, v in data.items() if k in known}
+        kwargs.setdefault("name", f"Level {index + 1}")
+        return cls(**kwargs)
+
+
 def load_levels():
     """Read level definitions from levels.json."""
     with open(LEVELS_FILE, "r") as fh:
-        return json.load(fh)
+        cfg = json.load(fh)
+    return [Level.from_dict(lv, i) for i, lv in enumerate(cfg["levels"])]
 
 
 def load_highscore():
@@ -106,18 +169,18 @@ def load_highscore():
         return 0
 
 
-def save_highscore(score):
-    """Write the high score if it beats the existing record.
+def save_highscore(score, current):
+    """Write the high score if it beats *current*, the record already held
+    in memory (so the file is never re-read).
     Wrapped broadly so a browser sandbox that blocks file writes won't crash."""
+    if score <= current:
+        return False
     try:
-        current = load_highscore()
-        if score > current:
-            with open(HIGHSCORE_FILE, "w") as fh:
-                json.dump({"high_score": score}, fh, indent=2)
-            return True
+        with open(HIGHSCORE_FILE, "w") as fh:
+            json.dump({"high_score": score}, fh, indent=2)
     except Exception:
         pass
-    return False
+    return True
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -180,12 +243,15 @@ def create_rock_surface(width, height, direction="up"):
     for _ in range(max(1, height // 80)):
         cx = random.randint(8, width - 8)
         cy = random.randint(body_y0 + 12, body_y1 - 12)
+        crack = [(cx, cy)]
         for _ in range(random.randint(2, 4)):
             nx = cx + random.randint(-4, 4)
             ny = cy + random.randint(4, 8)
             if body_y0 < ny < body_y1:
-                pygame.draw.line(surf, STONE_EDGE, (cx, cy), (nx, ny), 1)
+                crack.append((nx, ny))
                 cx, cy = nx, ny
+        if len(crack) > 1:
+            pygame.draw.lines(surf, STONE_EDGE, False, crack, 1)
 
     # ── Light highlight (left) & dark shadow (right) ──
     pygame.draw.line(surf, STONE_LIGHT, (2, body_y0), (2, body_y1), 2)
@@ -197,9 +263,7 @@ def create_rock_surface(width, height, direction="up"):
         mx = random.randint(6, width - 6)
         my = random.randint(body_y0 + 6, body_y1 - 6)
         r = random.randint(3, 6)
-        moss = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-        pygame.draw.circle(moss, (*MOSS_GREEN, 120), (r, r), r)
-        surf.blit(moss, (mx - r, my - r))
+        pygame.draw.circle(surf, MOSS_ON_STONE, (mx, my), r)
 
     # ── Body border ──
     pygame.draw.rect(surf, STONE_EDGE, (0, body_y0, width, body_h), 2)
@@ -207,6 +271,29 @@ def create_rock_surface(width, height, direction="up"):
     return surf
 
 
+def pillar_bucket(height):
+    """Round a pillar height up to its ROCK_HEIGHT_STEP bucket."""
+    return -(-height // ROCK_HEIGHT_STEP) * ROCK_HEIGHT_STEP
+
+
+def build_pillar_pool(min_h, max_h):
+    """
+    Pre-render PILLAR_VARIANTS rock surfaces for every height bucket
+    between *min_h* and *max_h*, in both directions.
+
+    Returns a dict keyed by (bucket_height, direction) holding a list of
+    Surfaces; walls only store an index into it.
+    """
+    pool = {}
+    for h in range(pillar_bucket(min_h), pillar_bucket(max_h) + 1,
+                   ROCK_HEIGHT_STEP):
+        for direction in ("down", "up"):
+            pool[(h, direction)] = [
+                create_rock_surface(WALL_WIDTH, h, direction).convert_alpha()
+                for _ in range(PILLAR_VARIANTS)]
+    return pool
+
+
 # ═══════════════════════════════════════════════════════════════════════
 #  Game objects
 # ═══════════════════════════════════════════════════════════════════════
@@ -216,22 +303,24 @@ class Player:
 
     def __init__(self):
         self.base_image = load_scaled_image("player.png", (PLAYER_W, PLAYER_H))
+        # Tilt sprites pre-rotated to every whole degree draw() can ask for
+        self._rot_cache = {
+            a: pygame.transform.rotate(self.base_image, a).convert_alpha()
+            for a in range(-25, 21)}
         self.x = PLAYER_X
         self.y = float(SCREEN_HEIGHT // 2 - PLAYER_H // 2)
         self.vel = 0.0
         self.alive = True
-        self.bob_t = 0.0  # start-screen bobbing timer
+        self.bob_t = 0  # start-screen bobbing phase (_SIN_LUT index)
 
         # Physics defaults (gravity overridden per level)
         self.gravity = 0.3
         self.flap_power = -6.0
         self.max_fall = 7.0
 
-    # ── Collision rect (slightly inset for forgiving hits) ──
-    @property
-    def rect(self):
-        return pygame.Rect(self.x + 8, int(self.y) + 8,
-                           PLAYER_W - 16, PLAYER_H - 16)
+        # Collision rect (slightly inset for forgiving hits), moved in place
+        self.rect = pygame.Rect(self.x + 8, int(self.y) + 8,
+                                PLAYER_W - 16, PLAYER_H - 16)
 
     def flap(self):
         if self.alive:
@@ -260,14 +349,16 @@ class Player:
             self.y = float(SCREEN_HEIGHT - PLAYER_H)
             self.alive = False
 
+        self.rect.y = int(self.y) + 8
+
     def bob(self):
         """Gentle floating animation used on the start screen."""
-        self.bob_t += 0.04
-        self.y = SCREEN_HEIGHT // 2 - PLAYER_H // 2 + math.sin(self.bob_t) * 18
+        self.bob_t = (self.bob_t + PLAYER_BOB_STEP) & SIN_LUT_MASK
+        self.y = SCREEN_HEIGHT // 2 - PLAYER_H // 2 + _SIN_LUT[self.bob_t] * 18
 
     def draw(self, surface):
-        angle = max(-25, min(20, -self.vel * 3))
-        rotated = pygame.transform.rotate(self.base_image, angle)
+        angle = max(-25, min(20, round(-self.vel * 3)))
+        rotated = self._rot_cache[angle]
         r = rotated.get_rect(
             center=(self.x + PLAYER_W // 2, int(self.y) + PLAYER_H // 2))
         surface.blit(rotated, r)
@@ -276,54 +367,65 @@ class Player:
         self.y = float(SCREEN_HEIGHT // 2 - PLAYER_H // 2)
         self.vel = 0.0
         self.alive = True
-        self.bob_t = 0.0
+        self.bob_t = 0
+        self.rect.y = int(self.y) + 8
 
 
 class WallPair:
     """Top stalactite + bottom stalagmite with a flyable gap between them."""
 
-    def __init__(self, x, gap_size, speed, gap_y=None):
+    def __init__(self, x, gap_size, speed, pool, gap_y=None):
         self.x = float(x)
         self.speed = speed
         self.gap_size = gap_size
         self.scored = False
 
         # Random gap centre (clamped so pillars aren't too short)
-        margin = 70
-        min_gy = margin + gap_size // 2
-        max_gy = SCREEN_HEIGHT - margin - gap_size // 2
+        min_gy = WALL_MARGIN + gap_size // 2
+        max_gy = SCREEN_HEIGHT - WALL_MARGIN - gap_size // 2
         self.gap_y = gap_y if gap_y else random.randint(min_gy, max_gy)
 
         # Pillar heights
         top_h = self.gap_y - gap_size // 2
         bot_h = SCREEN_HEIGHT - (self.gap_y + gap_size // 2)
 
-        self.top_surf = create_rock_surface(WALL_WIDTH, max(10, top_h), "down")
-        self.bot_surf = create_rock_surface(WALL_WIDTH, max(10, bot_h), "up")
-
         self._top_h = max(10, top_h)
         self._bot_start = self.gap_y + gap_size // 2
 
-    # Collision rectangles (body only — tips are cosmetic)
-    @property
-    def top_rect(self):
-        return pygame.Rect(int(self.x), 0, WALL_WIDTH, self._top_h)
-
-    @property
-    def bot_rect(self):
-        return pygame.Rect(int(self.x), self._bot_start,
-                           WALL_WIDTH, SCREEN_HEIGHT - self._bot_start)
+        # Pooled surfaces may be taller than the pillar: the stalactite is
+        # shifted up so its tip still meets the gap, the stalagmite simply
+        # runs past the bottom of the screen.
+        self._pool = pool
+        self._top_key = (pillar_bucket(self._top_h), "down")
+        self._bot_key = (pillar_bucket(max(10, bot_h)), "up")
+        self._top_variant = random.randrange(PILLAR_VARIANTS)
+        self._bot_variant = random.randrange(PILLAR_VARIANTS)
+        self._top_y = self._top_h - self._top_key[0]
+
+        # Collision rectangles (body only — tips are cosmetic)
+        self.top_rect = pygame.Rect(int(self.x), 0, WALL_WIDTH, self._top_h)
+        self.bot_rect = pygame.Rect(
+            int(self.x), self._bot_start,
+            WALL_WIDTH, SCREEN_HEIGHT - self._bot_start)
 
     def update(self):
         self.x -= self.speed
+        self.top_rect.x = self.bot_rect.x = int(self.x)
 
-    def draw(self, surface):
+    def blit_items(self):
+        """Return the (surface, position) pairs for both pillars."""
         ix = int(self.x)
-        # Stalactite – top of screen
-        surface.blit(self.top_surf, (ix, 0))
-        # Stalagmite – offset upward by WALL_TIP so the jagged tip
-        # visually connects to the gap edge
-        surface.blit(self.bot_surf, (ix, self._bot_start - WALL_TIP))
+        return [
+            # Stalactite – top of screen
+            (self._pool[self._top_key][self._top_variant], (ix, self._top_y)),
+            # Stalagmite – offset upward by WALL_TIP so the jagged tip
+            # visually connects to the gap edge
+            (self._pool[self._bot_key][self._bot_variant],
+             (ix, self._bot_start - WALL_TIP)),
+        ]
+
+    def draw(self, surface):
+        surface.blits(self.blit_items(), doreturn=False)
 
     def off_screen(self):
         return self.x + WALL_WIDTH < -10
@@ -336,27 +438,31 @@ class WallPair:
 class Enemy:
     """A raptor flying in from the right on a sinusoidal path."""
 
+    # Instances only hold their motion state; the sprite is shared
+    __slots__ = ("x", "base_y", "y", "speed",
+                 "wave_t", "wave_amp", "wave_spd", "rect")
+    image = None
+
     def __init__(self, speed):
-        img = load_scaled_image("enemy.png", (ENEMY_W, ENEMY_H))
-        self.image = pygame.transform.flip(img, True, False)  # face left
+        if Enemy.image is None:
+            img = load_scaled_image("enemy.png", (ENEMY_W, ENEMY_H))
+            Enemy.image = pygame.transform.flip(img, True, False)  # face left
         self.x = float(SCREEN_WIDTH + random.randint(20, 120))
         self.base_y = float(
             random.randint(40, SCREEN_HEIGHT - ENEMY_H - 40))
         self.y = self.base_y
         self.speed = speed
-        self.wave_t = random.uniform(0, 2 * math.pi)
+        self.wave_t = random.randrange(SIN_LUT_SIZE)  # _SIN_LUT index
         self.wave_amp = random.randint(25, 55)
-        self.wave_spd = random.uniform(0.025, 0.055)
-
-    @property
-    def rect(self):
-        return pygame.Rect(int(self.x) + 10, int(self.y) + 10,
-                           ENEMY_W - 20, ENEMY_H - 20)
+        self.wave_spd = lut_step(random.uniform(0.025, 0.055))
+        self.rect = pygame.Rect(int(self.x) + 10, int(self.y) + 10,
+                                ENEMY_W - 20, ENEMY_H - 20)
 
     def update(self):
         self.x -= self.speed
-        self.wave_t += self.wave_spd
-        self.y = self.base_y + math.sin(self.wave_t) * self.wave_amp
+        self.wave_t = (self.wave_t + self.wave_spd) & SIN_LUT_MASK
+        self.y = self.base_y + _SIN_LUT[self.wave_t] * self.wave_amp
+        self.rect.topleft = (int(self.x) + 10, int(self.y) + 10)
 
     def draw(self, surface):
         surface.blit(self.image, (int(self.x), int(self.y)))
@@ -371,23 +477,25 @@ class Enemy:
 class Coin:
     """Collectible gold coin that scrolls from right to left with a gentle bob."""
 
+    __slots__ = ("x", "base_y", "y", "speed", "bob_t", "rect")
+    image = None
+
     def __init__(self, x, y, speed):
-        self.image = load_scaled_image("coin.png", (COIN_W, COIN_H))
+        if Coin.image is None:
+            Coin.image = load_scaled_image("coin.png", (COIN_W, COIN_H))
         self.x = float(x)
         self.base_y = float(y)
         self.y = self.base_y
         self.speed = speed
-        self.bob_t = random.uniform(0, 2 * math.pi)
-
-    @property
-    def rect(self):
-        return pygame.Rect(int(self.x) + 4, int(self.y) + 4,
-                           COIN_W - 8, COIN_H - 8)
+        self.bob_t = random.randrange(SIN_LUT_SIZE)  # _SIN_LUT index
+        self.rect = pygame.Rect(int(self.x) + 4, int(self.y) + 4,
+                                COIN_W - 8, COIN_H - 8)
 
     def update(self):
         self.x -= self.speed
-        self.bob_t += 0.08
-        self.y = self.base_y + math.sin(self.bob_t) * 6
+        self.bob_t = (self.bob_t + COIN_BOB_STEP) & SIN_LUT_MASK
+        self.y = self.base_y + _SIN_LUT[self.bob_t] * 6
+        self.rect.topleft = (int(self.x) + 4, int(self.y) + 4)
 
     def draw(self, surface):
         surface.blit(self.image, (int(self.x), int(self.y)))
@@ -407,9 +515,12 @@ class Button:
         self.text = text
         self.font = pygame.font.Font(None, font_size)
         self.hover = False
+        self._last_mouse_pos = None
 
     def update(self, mouse_pos):
-        self.hover = self.rect.collidepoint(mouse_pos)
+        if mouse_pos != self._last_mouse_pos:
+            self._last_mouse_pos = mouse_pos
+            self.hover = self.rect.collidepoint(mouse_pos)
 
     def draw(self, surface):
         colour = BTN_HOVER if self.hover else BTN_NORMAL
@@ -420,7 +531,7 @@ class Button:
         pygame.draw.rect(surface, colour, self.rect, border_radius=10)
         pygame.draw.rect(surface, BTN_BORDER, self.rect, 3, border_radius=10)
         # Label
-        ts = self.font.render(self.text, True, WHITE)
+        ts = render_text(self.font, self.text, WHITE)
         surface.blit(ts, ts.get_rect(center=self.rect.center))
 
     def clicked(self, mouse_pos):
@@ -440,7 +551,9 @@ class Game:
 
     def __init__(self):
         # ── Background ──
-        self.bg = load_scaled_image("map.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Drawn first every frame, so an opaque copy blits without blending
+        self.bg = load_scaled_image(
+            "map.png", (SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
         self.bg_x = 0.0
 
         # ── Sounds (each loaded independently for robustness) ──
@@ -448,6 +561,8 @@ class Game:
         self.snd_enemy = self._try_load_sound("enemy.ogg", 0.35)
         self.snd_gameover = self._try_load_sound("gameover.ogg", 0.6)
         self.snd_coin = self._try_load_sound("coin.mp3", 0.6)
+        self.chan_flap = pygame.mixer.Channel(0)
+        self.chan_coin = pygame.mixer.Channel(1)
 
         try:
             pygame.mixer.music.load(os.path.join(SOUNDS_DIR, "bg.ogg"))
@@ -457,10 +572,14 @@ class Game:
             pass
 
         # ── Levels & high score ──
-        cfg = load_levels()
-        self.levels = cfg["levels"]
+        self.levels = load_levels()
         self.high_score = load_highscore()
 
+        # ── Pre-render pillars so wall spawns never rasterize rock ──
+        min_gap = min(max(lv.gap_size, PLAYER_H + 80) for lv in self.levels)
+        self._pillar_pool = build_pillar_pool(
+            WALL_MARGIN, SCREEN_HEIGHT - WALL_MARGIN - 2 * (min_gap // 2))
+
         # ── Fonts ──
         self.font_title = pygame.font.Font(None, 68)
         self.font_score = pygame.font.Font(None, 52)
@@ -477,6 +596,13 @@ class Game:
         # ── Coin HUD icon (small version of coin sprite) ──
         self.coin_hud_img = load_scaled_image("coin.png", (22, 22))
 
+        # ── Full-screen dark overlays, one per alpha ──
+        self._overlay_cache: dict[int, pygame.Surface] = {}
+
+        # ── Last gameplay scene, darkened, reused by the game-over screen ──
+        self._frozen_frame = pygame.Surface(
+            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+
         # ── Game state ──
         self.running = True
         self.state = self.START
@@ -489,6 +615,7 @@ class Game:
         self.grace_frames = 0   # no-gravity grace at round start
         self.enemy_timer = 0
         self.level_idx = 0
+        self._level_score = None  # score _level() last resolved against
 
     # ── Sound helper ──────────────────────────────────────────────────
 
@@ -505,14 +632,16 @@ class Game:
     # ── Level look-up ─────────────────────────────────────────────────
 
     def _level(self):
-        """Return the level dict whose score_threshold the player
-        hasn't exceeded yet."""
-        for i, lv in enumerate(self.levels):
-            if self.score < lv.get("score_threshold", 999999):
-                self.level_idx = i
-                return lv
-        self.level_idx = len(self.levels) - 1
-        return self.levels[-1]
+        """Return the Level whose score_threshold the player
+        hasn't reached yet (re-resolved only when the score changes)."""
+        if self.score != self._level_score:
+            self._level_score = self.score
+            self.level_idx = len(self.levels) - 1
+            for i, lv in enumerate(self.levels):
+                if self.score < lv.score_threshold:
+                    self.level_idx = i
+                    break
+        return self.levels[self.level_idx]
 
     # ── State transitions ─────────────────────────────────────────────
 
@@ -527,19 +656,39 @@ class Game:
         self.grace_frames = 50  # ~0.8 s of hovering before gravity kicks in
         self.enemy_timer = 0
         self.level_idx = 0
+        self._level_score = None  # force _level() to re-resolve on frame one
 
     def _game_over(self):
         self.state = self.GAME_OVER
         self.player.alive = False
         if self.snd_gameover:
             self.snd_gameover.play()
-        if save_highscore(self.score):
+
+        # The scene stops moving now, so render it (with its dark overlay)
+        # once; the background keeps scrolling underneath.
+        frozen = self._frozen_frame
+        frozen.fill((0, 0, 0, 0))
+        for w in self.walls:
+            w.draw(frozen)
+        for c in self.coins:
+            c.draw(frozen)
+        for e in self.enemies:
+            e.draw(frozen)
+        self.player.draw(frozen)
+        self._overlay(160, frozen)
+
+        if save_highscore(self.score, self.high_score):
             self.high_score = self.score
 
     # ── Event handling ────────────────────────────────────────────────
 
     def handle_events(self):
-        for ev in pygame.event.get():
+        # Only these types are handled in any state; the rest (mouse motion,
+        # window events, ...) is discarded unseen. Hover uses get_pos().
+        events = pygame.event.get(
+            (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN))
+        pygame.event.clear(pump=False)
+        for ev in events:
             if ev.type == pygame.QUIT:
                 self._quit()
 
@@ -559,7 +708,7 @@ class Game:
                 if do_flap:
                     self.player.flap()
                     if self.snd_flap:
-                        self.snd_flap.play()
+                        self.chan_flap.play(self.snd_flap)
                     # First flap cancels the grace hover
                     if self.grace_frames > 0:
                         self.grace_frames = 0
@@ -575,11 +724,9 @@ class Game:
     # ── Update logic ──────────────────────────────────────────────────
 
     def update(self):
-        mouse_pos = pygame.mouse.get_pos()
-
         # ····· START SCREEN ·····
         if self.state == self.START:
-            self.btn_start.update(mouse_pos)
+            self.btn_start.update(pygame.mouse.get_pos())
             self.player.bob()
             self.bg_x -= 0.3
             if self.bg_x <= -SCREEN_WIDTH:
@@ -588,7 +735,7 @@ class Game:
         # ····· PLAYING ·····
         elif self.state == self.PLAYING:
             lv = self._level()
-            grav = lv.get("gravity", 0.3)
+            grav = lv.gravity
 
             # Grace period (bird hovers at start)
             grace = self.grace_frames > 0
@@ -601,40 +748,45 @@ class Game:
                 return
 
             # Background parallax
-            self.bg_x -= lv.get("wall_speed", 2.0) * 0.25
+            self.bg_x -= lv.wall_speed * 0.25
             if self.bg_x <= -SCREEN_WIDTH:
                 self.bg_x += SCREEN_WIDTH
 
             # ── Wall spawning ──
-            wall_speed = lv.get("wall_speed", 2.0)
-            gap_size = max(lv.get("gap_size", 200), PLAYER_H + 80)
-            wall_spacing = lv.get("wall_spacing", 350)
+            wall_speed = lv.wall_speed
+            gap_size = max(lv.gap_size, PLAYER_H + 80)
+            wall_spacing = lv.wall_spacing
 
             wall_just_spawned = False
             if ((not self.walls)
                     or self.walls[-1].x < SCREEN_WIDTH - wall_spacing):
                 self.walls.append(
-                    WallPair(SCREEN_WIDTH + 40, gap_size, wall_speed))
+                    WallPair(SCREEN_WIDTH + 40, gap_size, wall_speed,
+                             self._pillar_pool))
                 wall_just_spawned = True
 
-            # ── Wall update ──
-            for w in self.walls[:]:
+            # ── Wall update (move, score, collide & cull in one pass) ──
+            player_rect = self.player.rect
+            px = self.player.x
+            remaining = []
+            for w in self.walls:
                 w.update()
                 # Score when the player passes a wall
-                if not w.scored and w.x + WALL_WIDTH < self.player.x:
+                if not w.scored and w.x + WALL_WIDTH < px:
                     w.scored = True
                     self.score += 1
-                # Collision
-                if w.collides(self.player.rect):
+                # Collision (cheap x-distance test first)
+                if (abs(w.x - px) < WALL_WIDTH + PLAYER_W
+                        and w.collides(player_rect)):
                     self._game_over()
                     return
-                # Clean-up
-                if w.off_screen():
-                    self.walls.remove(w)
+                if not w.off_screen():
+                    remaining.append(w)
+            self.walls = remaining
 
             # ── Enemy spawning ──
-            enemy_speed = lv.get("enemy_speed", 1.5)
-            enemy_freq = lv.get("enemy_spawn_frames", 500)
+            enemy_speed = lv.enemy_speed
+            enemy_freq = lv.enemy_spawn_frames
             self.enemy_timer += 1
             if self.enemy_timer >= enemy_freq:
                 self.enemies.append(Enemy(enemy_speed))
@@ -643,23 +795,26 @@ class Game:
                     self.snd_enemy.play()
 
             # ── Enemy update ──
-            for e in self.enemies[:]:
+            remaining = []
+            for e in self.enemies:
                 e.update()
-                if e.collides(self.player.rect):
+                if (abs(e.x - px) < ENEMY_W + PLAYER_W
+                        and e.collides(player_rect)):
                     self._game_over()
                     return
-                if e.off_screen():
-                    self.enemies.remove(e)
+                if not e.off_screen():
+                    remaining.append(e)
+            self.enemies = remaining
 
             # ── Coin spawning (triggered alongside wall spawn) ──
             if wall_just_spawned:
-                coin_chance = lv.get("coin_spawn_chance", 0.5)
-                max_coins = lv.get("max_coins_on_screen", 3)
+                coin_chance = lv.coin_spawn_chance
+                max_coins = lv.max_coins_on_screen
                 if (random.random() < coin_chance
                         and len(self.coins) < max_coins):
-                    speed_mult = lv.get("coin_speed_multiplier", 1.0)
-                    min_gap_px = lv.get("coin_min_gap_from_walls_px", 100)
-                    y_pad = lv.get("coin_y_padding_px", 50)
+                    speed_mult = lv.coin_speed_multiplier
+                    min_gap_px = lv.coin_min_gap_from_walls_px
+                    y_pad = lv.coin_y_padding_px
                     latest = self.walls[-1]
                     # Centre coin in the open space between walls
                     space = wall_spacing + 40 - WALL_WIDTH
@@ -681,20 +836,22 @@ class Game:
                              wall_speed * speed_mult))
 
             # ── Coin update ──
-            coin_value = lv.get("coin_value", 1)
-            for c in self.coins[:]:
+            coin_value = lv.coin_value
+            remaining = []
+            for c in self.coins:
                 c.update()
-                if c.collides(self.player.rect):
+                if (abs(c.x - px) < COIN_W + PLAYER_W
+                        and c.collides(player_rect)):
                     self.coins_collected += coin_value
-                    self.coins.remove(c)
                     if self.snd_coin:
-                        self.snd_coin.play()
-                elif c.off_screen():
-                    self.coins.remove(c)
+                        self.chan_coin.play(self.snd_coin)
+                elif not c.off_screen():
+                    remaining.append(c)
+            self.coins = remaining
 
         # ····· GAME OVER ·····
         elif self.state == self.GAME_OVER:
-            self.btn_restart.update(mouse_pos)
+            self.btn_restart.update(pygame.mouse.get_pos())
             self.bg_x -= 0.15
             if self.bg_x <= -SCREEN_WIDTH:
                 self.bg_x += SCREEN_WIDTH
@@ -702,10 +859,11 @@ class Game:
     # ── Drawing ───────────────────────────────────────────────────────
 
     def draw(self):
-        # Scrolling background (two copies side by side)
+        # Scrolling background (second copy only once the first has moved)
         bx = int(self.bg_x)
         screen.blit(self.bg, (bx, 0))
-        screen.blit(self.bg, (bx + SCREEN_WIDTH, 0))
+        if bx < 0:
+            screen.blit(self.bg, (bx + SCREEN_WIDTH, 0))
 
         if self.state == self.START:
             self._draw_start()
@@ -717,18 +875,21 @@ class Game:
         pygame.display.flip()
 
     # -- helper: dark overlay
-    def _overlay(self, alpha=130):
-        ov = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        ov.fill((0, 0, 0, alpha))
-        screen.blit(ov, (0, 0))
+    def _overlay(self, alpha=130, target=None):
+        ov = self._overlay_cache.get(alpha)
+        if ov is None:
+            ov = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            ov.fill((0, 0, 0, alpha))
+            self._overlay_cache[alpha] = ov
+        (screen if target is None else target).blit(ov, (0, 0))
 
     # -- helper: centred text
     def _text(self, text, font, colour, y, shadow=False):
         cx = SCREEN_WIDTH // 2
         if shadow:
-            s = font.render(text, True, TEXT_SHADOW)
+            s = render_text(font, text, TEXT_SHADOW)
             screen.blit(s, s.get_rect(center=(cx + 2, y + 2)))
-        t = font.render(text, True, colour)
+        t = render_text(font, text, colour)
         screen.blit(t, t.get_rect(center=(cx, y)))
 
     # -- Start screen
@@ -756,38 +917,28 @@ class Game:
 
     # -- Active gameplay
     def _draw_playing(self):
-        for w in self.walls:
-            w.draw(screen)
-        for c in self.coins:
-            c.draw(screen)
-        for e in self.enemies:
-            e.draw(screen)
+        # Walls, coins & enemies go to the screen in a single blits() call
+        seq = [item for w in self.walls for item in w.blit_items()]
+        seq += [(c.image, (int(c.x), int(c.y))) for c in self.coins]
+        seq += [(e.image, (int(e.x), int(e.y))) for e in self.enemies]
+        screen.blits(seq, doreturn=False)
         self.player.draw(screen)
 
         # HUD – score (centre)
         self._text(str(self.score), self.font_score, WHITE, 40, shadow=True)
         # HUD – level name
-        lv_name = self.levels[self.level_idx].get(
-            "name", f"Level {self.level_idx + 1}")
-        self._text(lv_name, self.font_small, TEXT_GOLD, 72)
+        self._text(self.levels[self.level_idx].name,
+                   self.font_small, TEXT_GOLD, 72)
         # HUD – coin counter (top-left)
         screen.blit(self.coin_hud_img, (14, 16))
-        coin_txt = self.font_info.render(
-            f"x {self.coins_collected}", True, TEXT_GOLD)
+        coin_txt = render_text(
+            self.font_info, f"x {self.coins_collected}", TEXT_GOLD)
         screen.blit(coin_txt, (40, 14))
 
     # -- Game-over overlay
     def _draw_gameover(self):
-        # Keep the last frame visible behind the overlay
-        for w in self.walls:
-            w.draw(screen)
-        for c in self.coins:
-            c.draw(screen)
-        for e in self.enemies:
-            e.draw(screen)
-        self.player.draw(screen)
-
-        self._overlay(160)
+        # Last frame behind the overlay, both baked in by _game_over()
+        screen.blit(self._frozen_frame, (0, 0))
 
         self._text("GAME OVER", self.font_title,
                     (225, 65, 45), 155, shadow=True)
@@ -820,7 +971,7 @@ class Game:
             await asyncio.sleep(0)  # yield to browser event loop
 
         # ── Cleanup after the loop exits ──
-        save_highscore(max(self.score, self.high_score))
+        save_highscore(self.score, self.high_score)
         try:
             pygame.mixer.music.stop()
         except Exception: